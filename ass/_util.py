@@ -1,42 +1,39 @@
-from collections import abc, OrderedDict
+from collections import abc
 
 
 class CaseInsensitiveOrderedDict(abc.MutableMapping):
     """A case insensitive ordered dictionary that preserves the original casing."""
 
     def __init__(self, *args, **kwargs):
-        self._dict = OrderedDict(*args, **kwargs)
-        self._case_mapping = {key.lower(): key for key in self._dict}
+        items = dict(*args, **kwargs)
+        # lowercased key -> (original key, value)
+        self._store = {key.lower(): (key, value) for key, value in items.items()}
 
-        if len(self._case_mapping) != len(self._dict):
+        if len(self._store) != len(items):
             raise ValueError("Duplicate keys provided for case insensitive dict")
 
     def __contains__(self, key):
-        if key.lower() in self._case_mapping:
-            return self._case_mapping[key.lower()] in self._dict
-        else:
-            return False
+        return key.lower() in self._store
 
     def __getitem__(self, key):
-        return self._dict[self._case_mapping[key.lower()]]
+        return self._store[key.lower()][1]
 
     def __setitem__(self, key, value):
-        if key.lower() not in self._case_mapping:
-            self._case_mapping[key.lower()] = key
-        self._dict[self._case_mapping[key.lower()]] = value
+        lower_key = key.lower()
+        existing = self._store.get(lower_key)
+        self._store[lower_key] = (key if existing is None else existing[0], value)
 
     def __delitem__(self, key):
-        del self._dict[self._case_mapping[key.lower()]]
-        del self._case_mapping[key.lower()]
+        del self._store[key.lower()]
 
     def __iter__(self):
-        return iter(self._dict)
+        return (key for key, _ in self._store.values())
 
     def __len__(self):
-        return len(self._dict)
+        return len(self._store)
 
     def __repr__(self):
-        return repr(self._dict)
+        return repr(dict(self._store.values()))
 
     def __str__(self):
-        return str(self._dict)
+        return str(dict(self._store.values()))
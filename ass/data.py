@@ -1,9 +1,15 @@
 from datetime import timedelta
 
+# color code -> (r, g, b, a); styles and tags tend to reuse a small palette
+_color_cache = {}
+_COLOR_CACHE_SIZE = 512
+
 
 class Color(object):
     """ Represents a color in the ASS format.
     """
+    __slots__ = ("r", "g", "b", "a", "__weakref__")
+
     def __init__(self, r, g, b, a=0):
         """ Made up of red, green, blue and alpha components (in that order!).
         """
@@ -12,36 +18,45 @@ class Color(object):
         self.b = b
         self.a = a
 
+    def __getstate__(self):
+        return self.r, self.g, self.b, self.a
+
+    def __setstate__(self, state):
+        if isinstance(state, dict):
+            # the instance __dict__, as pickled before Color used __slots__
+            state = state["r"], state["g"], state["b"], state["a"]
+        self.r, self.g, self.b, self.a = state
+
     def to_int(self):
         return self.a + (self.b << 8) + (self.g << 16) + (self.r << 24)
 
     def to_ass(self):
         """ Convert this color to a Visual Basic (ASS) color code.
         """
-        return "&H{a:02X}{b:02X}{g:02X}{r:02X}".format(**self.__dict__)
+        return "&H%02X%02X%02X%02X" % (self.a, self.b, self.g, self.r)
 
     @classmethod
     def from_ass(cls, v):
         """ Convert a Visual Basic (ASS) color code into an ``Color``.
         """
-        if not v.startswith("&H"):
-            raise ValueError("color must start with &H")
-
-        rest = int(v[2:], 16)
-
-        # AABBGGRR
-        r = rest & 0xFF
-        rest >>= 8
+        components = _color_cache.get(v)
+        if components is None:
+            if not v.startswith("&H"):
+                raise ValueError("color must start with &H")
 
-        g = rest & 0xFF
-        rest >>= 8
+            digits = v[2:].strip()
+            if not digits:
+                raise ValueError("color has no hex digits")
 
-        b = rest & 0xFF
-        rest >>= 8
+            # AABBGGRR, left-padded; only the lowest four bytes are significant
+            a, b, g, r = bytes.fromhex(digits.rjust(8, "0")[-8:])
+            components = (r, g, b, a)
 
-        a = rest & 0xFF
+            if len(_color_cache) < _COLOR_CACHE_SIZE:
+                _color_cache[v] = components
 
-        return cls(r, g, b, a)
+        # colors are mutable, so always hand out a fresh instance
+        return cls(*components)
 
     def __repr__(self):
         return "{name}(r=0x{r:02x}, g=0x{g:02x}, b=0x{b:02x}, a=0x{a:02x})".format(
@@ -59,12 +74,15 @@ Color.BLACK = Color(0, 0, 0)
 
 
 class _Field(object):
+    __slots__ = ("name", "type", "default", "_creation_order", "_parse")
+
     _last_creation_order = -1
 
     def __init__(self, name, type, default=None):
         self.name = name
         self.type = type
         self.default = default
+        self._parse = self._make_parser(type)
 
         _Field._last_creation_order += 1
         self._creation_order = self._last_creation_order
@@ -79,6 +97,11 @@ class _Field(object):
 
     @staticmethod
     def dump(v):
+        dumper = _DUMPERS.get(type(v))
+        if dumper is not None:
+            return dumper(v)
+
+        # subclasses of the common types and anything else
         if v is None:
             return ""
 
@@ -97,19 +120,20 @@ class _Field(object):
         return str(v)
 
     def parse(self, v):
-        if self.type is None:
-            return None
-
-        if self.type is bool:
-            return bool(-int(v))
+        return self._parse(v)
 
-        if self.type is timedelta:
-            return _Field.timedelta_from_ass(v)
+    @staticmethod
+    def _make_parser(type):
+        """ Resolve the parse function for a field type once, at creation time.
+        """
+        parser = _PARSERS.get(type)
+        if parser is not None:
+            return parser
 
-        if hasattr(self.type, "from_ass"):
-            return self.type.from_ass(v)
+        if hasattr(type, "from_ass"):
+            return type.from_ass
 
-        return self.type(v)
+        return type
 
     @staticmethod
     def timedelta_to_ass(td):
@@ -127,12 +151,51 @@ class _Field(object):
 
     @staticmethod
     def timedelta_from_ass(v):
-        secs_str, _, csecs = v.partition(".")
-        hours, mins, secs = map(int, secs_str.split(":"))
+        # H:MM:SS.cc, parsed with integer arithmetic only
+        hours_end = v.index(":")
+        mins_end = v.index(":", hours_end + 1)
+        secs_end = v.index(".", mins_end + 1)
+
+        hours = int(v[:hours_end])
+        mins = int(v[hours_end + 1:mins_end])
+        secs = int(v[mins_end + 1:secs_end])
+        csecs = int(v[secs_end + 1:])
+
+        return timedelta(microseconds=((hours * 3600 + mins * 60 + secs) * 100 + csecs) * 10000)
+
+
+_DUMPERS = {
+    type(None): lambda v: "",
+    bool: lambda v: str(-int(v)),
+    timedelta: _Field.timedelta_to_ass,
+    float: "{0:g}".format,
+    int: str,
+    str: str,
+    Color: Color.to_ass,
+}
+
+_PARSERS = {
+    None: lambda v: None,
+    bool: lambda v: bool(-int(v)),
+    timedelta: _Field.timedelta_from_ass,
+}
+
+
+def _make_default_dumper(field_defs):
+    """ Build a dump function for the default field order, specialized to the
+    declared type of each field. Values of other types use ``_Field.dump``.
+    """
+    names = tuple(f.name for f in field_defs)
+    types = tuple(f.type for f in field_defs)
+    dumpers = tuple(_DUMPERS.get(f.type, _Field.dump) for f in field_defs)
+    dump = _Field.dump
 
-        r = hours * 60 * 60 + mins * 60 + secs + int(csecs) * 1e-2
+    def dump_default(fields):
+        return ",".join([dumper(v) if type(v) is field_type else dump(v)
+                         for v, field_type, dumper
+                         in zip(map(fields.__getitem__, names), types, dumpers)])
 
-        return timedelta(seconds=r)
+    return dump_default
 
 
 class _WithFieldMeta(type):
@@ -163,4 +226,7 @@ class _WithFieldMeta(type):
         newcls._field_attributes = field_attributes
 
         newcls.DEFAULT_FIELD_ORDER = tuple(f.name for f in field_defs)
+        newcls._DEFAULTS = {f.name: f.default for f in field_defs}
+        newcls._DEFAULT_PARSERS = tuple(f._parse for f in field_defs)
+        newcls._dump_default = staticmethod(_make_default_dumper(field_defs))
         return newcls
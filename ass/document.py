@@ -1,6 +1,7 @@
 import codecs
 
 from .section import ScriptInfoSection, FieldSection, StylesSection, EventsSection, LineSection
+from .section import _check_chunks
 from ._util import CaseInsensitiveOrderedDict
 
 from .line import *  # noqa: F40  # re-export for compatibility
@@ -75,61 +76,99 @@ class Document(object):
     events = _section_property(EVENTS_HEADER)
 
     @classmethod
-    def parse_file(cls, f):
+    def parse_file(cls, f, executor=None, chunks=None):
         """ Parse an ASS document from a file object.
+
+        Passing a ``concurrent.futures`` executor, such as a
+        ``ProcessPoolExecutor``, parses the lines of large sections in parallel,
+        split into ``chunks`` chunks (by default one per CPU). Match it to the
+        executor's number of workers.
+        """
+        read = getattr(f, "read", None)
+        if read is None:
+            # plain iterable of lines
+            return cls._parse_lines(list(f), executor, chunks)
+
+        return cls._parse_lines(read().split("\n"), executor, chunks)
+
+    @classmethod
+    def parse_string(cls, string, executor=None, chunks=None):
+        """ Parse an ASS document from a string.
         """
+        return cls._parse_lines(string.split("\n"), executor, chunks)
+
+    @classmethod
+    def _parse_lines(cls, lines, executor=None, chunks=None):
+        # lines are split on "\n" only; splitlines() would also break on characters
+        # like \x0c or \u2028 that may legitimately appear in dialogue text
+        _check_chunks(chunks)
         doc = cls()
 
-        section = None
-        seen_sections = CaseInsensitiveOrderedDict()
-        for i, line in enumerate(f):
-            if i == 0:
-                bom_seqeunces = ("\xef\xbb\xbf", "\xff\xfe", "\ufeff")
-                if any(line.startswith(seq) for seq in bom_seqeunces):
-                    raise ValueError("BOM detected. Please open the file with the proper encoding,"
-                                     " usually '%s'" % cls.PREFERRED_ENCODING.name)
+        bom_sequences = ("\xef\xbb\xbf", "\xff\xfe", "\ufeff")
+        if lines and lines[0].startswith(bom_sequences):
+            raise ValueError("BOM detected. Please open the file with the proper encoding,"
+                             " usually '%s'" % cls.PREFERRED_ENCODING.name)
+
+        # plain lowercased lookup table for the section headers below
+        section_types = {name.lower(): section_type
+                         for name, section_type in cls.SECTIONS.items()}
 
+        section = None
+        # lowercased name -> (name, section), in order of first appearance
+        seen_sections = {}
+        # lines of the current section, batched when parsing with an executor
+        pending = []
+        for line in lines:
             line = line.strip()
-            if not line or line.startswith(';'):
+            if not line:
+                continue
+
+            first_char = line[0]
+            if first_char == ';':
                 continue
 
-            if line.startswith('[') and line.endswith(']'):
+            if first_char == '[' and line[-1] == ']':
+                if pending:
+                    section.add_lines(pending, executor, chunks)
+                    pending = []
+
                 section_name = line[1:-1]
+                key = section_name.lower()
                 # use existing section if available (pre-generated script info, styles, events)
                 if section_name in doc.sections:
                     section = doc.sections[section_name]
                 else:
-                    section = doc.SECTIONS.get(section_name, LineSection)(section_name)
+                    section = section_types.get(key, LineSection)(section_name)
 
-                seen_sections[section_name] = section
+                # keep the casing under which the section was first seen
+                seen_name = seen_sections[key][0] if key in seen_sections else section_name
+                seen_sections[key] = (seen_name, section)
                 continue
 
             if section is None:
                 raise ValueError('Content outside of any section.')
 
-            if ':' not in line:
+            colon = line.find(":")
+            if colon < 0:
                 # illformed, ignore
                 continue
 
-            type_name, _, line = line.partition(":")
-            line = line.lstrip()
-            section.add_line(type_name, line)
+            if executor is not None and isinstance(section, LineSection):
+                pending.append((line[:colon], line[colon + 1:].lstrip()))
+            else:
+                section.add_line(line[:colon], line[colon + 1:].lstrip())
+
+        if pending:
+            section.add_lines(pending, executor, chunks)
 
         # append default sections not present in the parsed file
         for section_name, section in doc.sections.items():
-            if section_name not in seen_sections:
-                seen_sections[section_name] = section
+            seen_sections.setdefault(section_name.lower(), (section_name, section))
 
-        doc.sections = seen_sections
+        doc.sections = CaseInsensitiveOrderedDict(seen_sections.values())
 
         return doc
 
-    @classmethod
-    def parse_string(cls, string):
-        """ Parse an ASS document from a string.
-        """
-        return cls.parse_file(string.splitlines())
-
     @classmethod
     def is_preferred_encoding(cls, encoding):
         try:
@@ -147,11 +186,14 @@ class Document(object):
             warnings.warn("It is recommended to write UTF-8 with BOM"
                           " using the '%s' encoding" % self.PREFERRED_ENCODING.name)
 
-        first = True
+        # collect everything first and issue a single write
+        buf = []
+        append = buf.append
         for section in self.sections.values():
-            if not first:
-                f.write("\n")
+            if buf:
+                append("\n")
             for line in section.dump():
-                f.write(line)
-                f.write("\n")
-            first = False
+                append(line)
+                append("\n")
+
+        f.write("".join(buf))
@@ -15,12 +15,13 @@ __all__ = (
 
 
 class _Line(object, metaclass=_WithFieldMeta):
-    # to be overridden in subclasses or through the type_name argument
+    # TYPE is to be overridden in subclasses or set through the type_name argument,
+    # which stores it in the slot below
     # TODO remove; it's primarily kept for backwards compat but not good architecture
-    TYPE = None
+    __slots__ = ("fields", "TYPE", "__weakref__")
 
     def __init__(self, *args, type_name=None, **kwargs):
-        self.fields = {f.name: f.default for f in self._field_defs}
+        self.fields = self._DEFAULTS.copy()
 
         for k, v in zip(self.DEFAULT_FIELD_ORDER, args):
             self.fields[k] = v
@@ -31,15 +32,33 @@ class _Line(object, metaclass=_WithFieldMeta):
             else:
                 self.fields[k] = v
 
-        if self.TYPE is None:
+        if getattr(self, "TYPE", None) is None:
+            self.TYPE = type_name
+
+    def __getstate__(self):
+        # the fields and the type name make up a line, plus any attributes of
+        # subclasses that do not declare __slots__
+        return self.fields, self.TYPE, getattr(self, "__dict__", None)
+
+    def __setstate__(self, state):
+        if isinstance(state, dict):
+            # the instance __dict__, as pickled before lines used __slots__
+            attributes = dict(state)
+            self.fields = attributes.pop("fields")
+            type_name = attributes.pop("TYPE", None)
+        else:
+            self.fields, type_name, attributes = state
+        if attributes:
+            self.__dict__.update(attributes)
+        if getattr(self, "TYPE", None) is None:
             self.TYPE = type_name
 
     def dump(self, field_order=None):
         """ Dump an ASS line into text format. Has an optional field order
         parameter in case you have some wonky format.
         """
-        if field_order is None:
-            field_order = self.DEFAULT_FIELD_ORDER
+        if field_order is None or field_order is self.DEFAULT_FIELD_ORDER:
+            return self._dump_default(self.fields)
 
         return ",".join(_Field.dump(self.fields[field])
                         for field in field_order)
@@ -61,12 +80,18 @@ class _Line(object, metaclass=_WithFieldMeta):
         if len(parts) != len(field_order):
             raise ValueError("arity of line does not match arity of field order")
 
-        fields = {}
+        if field_order is cls.DEFAULT_FIELD_ORDER:
+            # fast path: every field is known, so skip the mapping lookups
+            fields = {field_name: parse(field)
+                      for field_name, parse, field
+                      in zip(cls.DEFAULT_FIELD_ORDER, cls._DEFAULT_PARSERS, parts)}
+        else:
+            fields = {}
 
-        for field_name, field in zip(field_order, parts):
-            if field_name in cls._field_mappings:
-                field = cls._field_mappings[field_name].parse(field)
-            fields[field_name] = field
+            for field_name, field in zip(field_order, parts):
+                if field_name in cls._field_mappings:
+                    field = cls._field_mappings[field_name].parse(field)
+                fields[field_name] = field
 
         return cls(**fields, type_name=type_name)
 
@@ -77,6 +102,8 @@ class _Line(object, metaclass=_WithFieldMeta):
 
 
 class Unknown(_Line):
+    __slots__ = ()
+
     value = _Field("Value", str, default="")
 
 
@@ -84,6 +111,7 @@ class Style(_Line):
     """ A style line in ASS.
     """
     TYPE = "Style"
+    __slots__ = ()
 
     name = _Field("Name", str, default="Default")
     fontname = _Field("Fontname", str, default="Arial")
@@ -111,6 +139,8 @@ class Style(_Line):
 
 
 class _Event(_Line):
+    __slots__ = ()
+
     layer = _Field("Layer", int, default=0)
     start = _Field("Start", timedelta, default=timedelta(0))
     end = _Field("End", timedelta, default=timedelta(0))
@@ -127,33 +157,39 @@ class Dialogue(_Event):
     """ A dialog event.
     """
     TYPE = "Dialogue"
+    __slots__ = ()
 
 
 class Comment(_Event):
     """ A comment event.
     """
     TYPE = "Comment"
+    __slots__ = ()
 
 
 class Picture(_Event):
     """ A picture event. Not widely supported.
     """
     TYPE = "Picture"
+    __slots__ = ()
 
 
 class Sound(_Event):
     """ A sound event. Not widely supported.
     """
     TYPE = "Sound"
+    __slots__ = ()
 
 
 class Movie(_Event):
     """ A movie event. Not widely supported.
     """
     TYPE = "Movie"
+    __slots__ = ()
 
 
 class Command(_Event):
     """ A command event. Not widely supported.
     """
     TYPE = "Command"
+    __slots__ = ()
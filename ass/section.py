@@ -1,4 +1,5 @@
-from collections import abc, OrderedDict
+import os
+from collections import abc
 
 from .line import Unknown, Dialogue, Movie, Command, Sound, Picture, Comment, Style
 from .data import _Field
@@ -12,11 +13,45 @@ __all__ = (
 )
 
 
+def _parse_chunk(section_type, name, field_order, lines):
+    """ Parse a chunk of lines in a scratch section; run by executor workers.
+    """
+    section = section_type(name)
+    section.field_order = field_order
+    for type_name, raw_line in lines:
+        section.add_line(type_name, raw_line)
+    return section._lines
+
+
+def _line_field_order(field_order, line_type):
+    """ Return the field order to hand to lines of ``line_type``: the class's own
+    DEFAULT_FIELD_ORDER when equal, so they can take their default-order fast path.
+    """
+    if field_order is None or tuple(field_order) == line_type.DEFAULT_FIELD_ORDER:
+        return line_type.DEFAULT_FIELD_ORDER
+    return field_order
+
+
+def _check_chunks(chunks):
+    if chunks is not None and chunks < 1:
+        raise ValueError("chunks must be at least 1, got {!r}".format(chunks))
+
+
 class LineSection(abc.MutableSequence):
     FORMAT_TYPE = "Format"
     line_parsers = None
     field_order = None
 
+    # runs shorter than this are not worth shipping to an executor
+    PARALLEL_MIN_LINES = 10000
+
+    # single-slot cache for the parser of the last seen line type, and the field
+    # order to parse it with, resolved from a snapshot of field_order
+    _last_type = None
+    _last_parser = None
+    _last_field_order = None
+    _last_line_field_order = None
+
     def __init__(self, name, lines=None):
         self.name = name
         self._lines = [] if lines is None else lines
@@ -27,13 +62,25 @@ class LineSection(abc.MutableSequence):
         if self.field_order is not None:
             yield "{}: {}".format(LineSection.FORMAT_TYPE, ", ".join(self.field_order))
 
+        # resolve the field order once per line class instead of once per line
+        line_field_orders = {}
         for line in self._lines:
-            yield line.dump_with_type(self.field_order)
+            line_type = type(line)
+            if line_type not in line_field_orders:
+                line_field_orders[line_type] = _line_field_order(self.field_order, line_type)
+            yield line.dump_with_type(line_field_orders[line_type])
 
     def add_line(self, type_name, raw_line):
+        field_order = self.field_order
+        # nearly all lines of a section share a type, so try the last one first;
+        # comparing against the snapshot also notices in-place edits of field_order
+        if type_name == self._last_type and field_order == self._last_field_order:
+            parser = self._last_parser
+            line_field_order = self._last_line_field_order
         # field order is optional
-        if type_name.lower() == LineSection.FORMAT_TYPE.lower():
+        elif type_name.lower() == LineSection.FORMAT_TYPE.lower():
             self.field_order = [field.strip() for field in raw_line.split(",")]
+            return
         else:
             if self.line_parsers is not None and type_name.lower() not in self.line_parsers:
                 raise ValueError("unexpected {} line in {}".format(type_name, self.name))
@@ -41,7 +88,48 @@ class LineSection(abc.MutableSequence):
             parser = (self.line_parsers[type_name.lower()]
                       if self.line_parsers is not None
                       else Unknown)
-            self._lines.append(parser.parse(type_name, raw_line, self.field_order))
+            line_field_order = _line_field_order(field_order, parser)
+
+            self._last_type = type_name
+            self._last_parser = parser
+            self._last_field_order = None if field_order is None else field_order[:]
+            self._last_line_field_order = line_field_order
+
+        self._lines.append(parser.parse(type_name, raw_line, line_field_order))
+
+    def add_lines(self, lines, executor=None, chunks=None):
+        """ Add a sequence of ``(type_name, raw_line)`` pairs. If an executor is
+        given, long runs of lines are split into ``chunks`` chunks (by default
+        one per CPU) and parsed on it.
+        """
+        _check_chunks(chunks)
+
+        run = []
+        for type_name, raw_line in lines:
+            if type_name.lower() == LineSection.FORMAT_TYPE.lower():
+                # the field order applies to all following lines
+                self._add_run(run, executor, chunks)
+                run = []
+                self.add_line(type_name, raw_line)
+            else:
+                run.append((type_name, raw_line))
+
+        self._add_run(run, executor, chunks)
+
+    def _add_run(self, run, executor, chunks):
+        if executor is None or len(run) < self.PARALLEL_MIN_LINES:
+            for type_name, raw_line in run:
+                self.add_line(type_name, raw_line)
+            return
+
+        if chunks is None:
+            chunks = os.cpu_count() or 1
+        chunk_size = -(-len(run) // chunks)
+        futures = [executor.submit(_parse_chunk, type(self), self.name, self.field_order,
+                                   run[i:i + chunk_size])
+                   for i in range(0, len(run), chunk_size)]
+        for future in futures:
+            self._lines.extend(future.result())
 
     def set_data(self, lines):
         if not isinstance(lines, abc.MutableSequence):
@@ -73,7 +161,7 @@ class FieldSection(abc.MutableMapping):
 
     def __init__(self, name, fields=None):
         self.name = name
-        self._fields = OrderedDict() if fields is None else fields
+        self._fields = {} if fields is None else fields
 
     def add_line(self, field_name, field):
         if field_name in self.FIELDS:
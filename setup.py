@@ -24,6 +24,7 @@ setup(
         'Topic :: Software Development :: Libraries',
         'Topic :: Text Processing :: Markup',
     ],
+    python_requires=">=3.7",
     install_requires=["setuptools"],
     zip_safe=True,
 )
@@ -1,5 +1,10 @@
 #!/usr/bin/env python
 
+import copy
+import pickle
+import weakref
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import timedelta
 from io import StringIO
 from pathlib import Path
 from textwrap import dedent
@@ -11,6 +16,10 @@ import ass
 folder = Path(__file__).parent
 
 
+class UnslottedDialogue(ass.Dialogue):
+    pass
+
+
 class TestDocument:
 
     test_ass = Path(folder, "test.ass")
@@ -25,6 +34,73 @@ class TestDocument:
 
         assert out.getvalue() == contents
 
+    def test_parse_line_separators_in_text(self):
+        contents = dedent("""\
+            [Events]
+            Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
+            Dialogue: 0,0:00:00.00,0:00:05.00,Default,,0,0,0,,x\u2028y\x0cz\x85w
+            """)
+
+        for doc in (ass.parse(StringIO(contents)), ass.parse_string(contents)):
+            assert doc.events[0].text == "x\u2028y\x0cz\x85w"
+
+    def test_parse_field_order(self):
+        with self.test_ass.open("r", encoding='utf_8_sig') as f:
+            doc = ass.parse(f)
+
+        assert doc.events.field_order == list(ass.Dialogue.DEFAULT_FIELD_ORDER)
+
+        # editing the parsed field order in place applies to later lines
+        doc.events.field_order.remove("Effect")
+        doc.events.add_line("Dialogue", "0,0:00:00.00,0:00:05.00,Default,,0,0,0,a,b")
+        assert doc.events[-1].text == "a,b"
+        assert doc.events[-1].dump(doc.events.field_order) \
+            == "0,0:00:00.00,0:00:05.00,Default,,0,0,0,a,b"
+
+    @pytest.mark.parametrize("executor_type", [ThreadPoolExecutor, ProcessPoolExecutor])
+    def test_parse_executor(self, executor_type, monkeypatch):
+        monkeypatch.setattr(ass.LineSection, "PARALLEL_MIN_LINES", 1)
+        with self.test_ass.open("r", encoding='utf_8_sig') as f:
+            contents = f.read()
+
+        with executor_type(max_workers=2) as executor:
+            doc = ass.parse(StringIO(contents), executor=executor)
+        out = StringIO()
+        doc.dump_file(out)
+
+        assert out.getvalue() == contents
+
+    def test_parse_executor_chunks(self, monkeypatch):
+        monkeypatch.setattr(ass.LineSection, "PARALLEL_MIN_LINES", 1)
+        with self.test_ass.open("r", encoding='utf_8_sig') as f:
+            contents = f.read()
+
+        submitted = []
+
+        class CountingExecutor(ThreadPoolExecutor):
+            def submit(self, fn, *args, **kwargs):
+                submitted.append(args)
+                return super().submit(fn, *args, **kwargs)
+
+        with CountingExecutor(max_workers=2) as executor:
+            doc = ass.parse(StringIO(contents), executor=executor, chunks=2)
+
+        event_chunks = [args[-1] for args in submitted if args[1] == "Events"]
+        assert len(event_chunks) == 2
+        assert sum(map(len, event_chunks)) == len(doc.events)
+
+    @pytest.mark.parametrize("chunks", [0, -1])
+    def test_parse_executor_invalid_chunks(self, chunks):
+        with self.test_ass.open("r", encoding='utf_8_sig') as f:
+            contents = f.read()
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            with pytest.raises(ValueError):
+                ass.parse(StringIO(contents), executor=executor, chunks=chunks)
+
+            with pytest.raises(ValueError):
+                ass.EventsSection("Events").add_lines([], executor, chunks)
+
     def test_parse_encoding(self):
         with self.test_ass.open("r", encoding='utf_8') as f:
             with pytest.raises(ValueError):
@@ -48,6 +124,82 @@ class TestDocument:
                 doc.dump_file(f)
 
 
+class TestData:
+
+    def test_timedelta_from_ass(self):
+        td = ass.data._Field.timedelta_from_ass("1:02:03.45")
+        assert td == timedelta(hours=1, minutes=2, seconds=3, milliseconds=450)
+        assert ass.data._Field.timedelta_to_ass(td) == "1:02:03.45"
+
+        with pytest.raises(ValueError):
+            ass.data._Field.timedelta_from_ass("1:02:03")
+
+    def test_color_from_ass(self):
+        color = ass.data.Color.from_ass("&H80FF0000")
+        assert (color.r, color.g, color.b, color.a) == (0x00, 0x00, 0xFF, 0x80)
+
+        # cached colors are handed out as independent instances
+        color.r = 1
+        assert ass.data.Color.from_ass("&H80FF0000").r == 0
+
+        for invalid in ("&H", "&H  ", "00FF0000", "&HXYZ"):
+            with pytest.raises(ValueError):
+                ass.data.Color.from_ass(invalid)
+
+
+class TestLines:
+
+    def test_weakref(self):
+        for obj in (ass.Dialogue(), ass.Unknown(type_name="Line"), ass.data.Color(1, 2, 3)):
+            assert weakref.ref(obj)() is obj
+
+    def test_type_name(self):
+        assert ass.line._Event(type_name="X").dump_with_type() \
+            == "X: 0,0:00:00.00,0:00:00.00,Default,,0,0,0,,"
+        assert ass.line._Line(type_name="X").TYPE == "X"
+        assert ass.Unknown("1", type_name="Line").TYPE == "Line"
+        assert ass.Dialogue(type_name="X").TYPE == "Dialogue"
+
+    @pytest.mark.parametrize("clone", [
+        copy.copy,
+        copy.deepcopy,
+        lambda line: pickle.loads(pickle.dumps(line)),
+    ])
+    def test_clone(self, clone):
+        dialogue = clone(ass.Dialogue(text="hi"))
+        assert dialogue.TYPE == "Dialogue"
+        assert dialogue.text == "hi"
+
+        unknown = clone(ass.Unknown("1", type_name="Line"))
+        assert unknown.TYPE == "Line"
+        assert unknown.value == "1"
+
+        line = UnslottedDialogue(text="hi")
+        line.note = 1
+        line = clone(line)
+        assert line.note == 1
+        assert line.dump_with_type() == "Dialogue: 0,0:00:00.00,0:00:00.00,Default,,0,0,0,,hi"
+
+    def test_legacy_state(self):
+        dialogue = ass.Dialogue.__new__(ass.Dialogue)
+        dialogue.__setstate__({"fields": ass.Dialogue(text="hi").fields})
+        assert dialogue.TYPE == "Dialogue"
+        assert dialogue.text == "hi"
+
+        unknown = ass.Unknown.__new__(ass.Unknown)
+        unknown.__setstate__({"fields": {"Value": "1"}, "TYPE": "Line"})
+        assert unknown.TYPE == "Line"
+        assert unknown.value == "1"
+
+        line = UnslottedDialogue.__new__(UnslottedDialogue)
+        line.__setstate__({"fields": ass.Dialogue().fields, "note": 1})
+        assert line.note == 1
+
+        color = ass.data.Color.__new__(ass.data.Color)
+        color.__setstate__({"r": 1, "g": 2, "b": 3, "a": 4})
+        assert color.to_ass() == "&H04030201"
+
+
 class TestSections:
 
     def test_default_sections(self):